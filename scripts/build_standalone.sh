@@ -16,7 +16,7 @@ source venv/bin/activate 2>/dev/null || source venv/Scripts/activate 2>/dev/null
 
 # Install dependencies
 echo "Installing dependencies..."
-pip install -q requests openai pyinstaller
+pip install -q 'httpx[http2]' openai tenacity pyinstaller
 
 # Create PyInstaller spec file
 cat > voice_summary.spec << 'EOF'
@@ -27,7 +27,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['openai', 'requests'],
+    hiddenimports=['openai', 'httpx', 'h2', 'tenacity'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
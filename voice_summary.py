@@ -7,13 +7,37 @@ Automatically transcribe and summarize voice recordings from Zendesk tickets
 import os
 import sys
 import time
-import requests
+import asyncio
+import threading
+import httpx
 import re
+import json
+import hashlib
+import functools
+import shutil
+import tempfile
 import argparse
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
-from openai import OpenAI
+import openai
+from openai import AsyncOpenAI
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
+try:
+    import tiktoken
+except ImportError:
+    # Token counts fall back to a character-based estimate
+    tiktoken = None
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    # Python < 3.9 fallback
+    try:
+        from pytz import timezone as ZoneInfo
+    except ImportError:
+        ZoneInfo = None
 
 # --- Configuration ---
 # Set these environment variables or modify the defaults below
@@ -32,89 +56,250 @@ if not all([ZENDESK_EMAIL, ZENDESK_PASSWORD, OPENAI_API_KEY]):
     print("  - ZENDESK_DOMAIN (optional): Your Zendesk domain (default: yourcompany.zendesk.com)")
     sys.exit(1)
 
+# OpenAI rate limits (per minute) - match these to your account's tier
+RATE_LIMIT_SETTINGS = {'WHISPER_RPM': '50', 'GPT_RPM': '500', 'GPT_TPM': '500000'}
+rate_limits = {}
+for name, default in RATE_LIMIT_SETTINGS.items():
+    value = os.getenv(name, default)
+    try:
+        rate_limits[name] = int(value)
+    except ValueError:
+        rate_limits[name] = 0
+    if rate_limits[name] <= 0:
+        print(f"Error: {name} must be a positive integer (got '{value}')")
+        sys.exit(1)
+
+WHISPER_REQUESTS_PER_MINUTE = rate_limits['WHISPER_RPM']
+GPT_REQUESTS_PER_MINUTE = rate_limits['GPT_RPM']
+GPT_TOKENS_PER_MINUTE = rate_limits['GPT_TPM']
+
 AUTH = (ZENDESK_EMAIL, ZENDESK_PASSWORD)
 
-# Initialize OpenAI client
-client = OpenAI(api_key=OPENAI_API_KEY)
+# Connection pool configuration
+HTTP_POOL_SIZE = 32
+
+# Download configuration
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Long recording configuration (requires ffmpeg on PATH)
+FFMPEG = shutil.which('ffmpeg')
+SPLIT_THRESHOLD = 600  # seconds; longer recordings are split before transcription
+SEGMENT_LENGTH = 300  # seconds per transcription chunk
+MAX_CONCURRENT_CHUNK_UPLOADS = 4  # across all recordings and tickets
+
+# Bulk comment posting (Zendesk accepts up to 100 tickets per update_many request)
+BULK_UPDATE_LIMIT = 100
+JOB_POLL_INTERVAL = 2  # seconds
+JOB_POLL_TIMEOUT = 120  # seconds
+
+# Summaries are cached here, keyed by a hash of their inputs
+SUMMARY_CACHE_DIR = Path('.cache')
+
+# Timestamps are shown in Mountain Time (handles both MST and MDT)
+try:
+    MOUNTAIN_TZ = ZoneInfo('America/Denver') if ZoneInfo else None
+except Exception:
+    MOUNTAIN_TZ = None
+
+# Precompiled patterns
+TICKET_URL_RE = re.compile(r'/tickets/(\d+)')
+NON_DIGIT_RE = re.compile(r'\D+')
+TICKET_SEPARATOR_RE = re.compile(r'[,\s]+')
+
+# Initialize HTTP and OpenAI clients
+# A single pooled client keeps TLS connections to Zendesk alive between
+# requests. No custom transport is passed, as that would disable the
+# HTTP_PROXY/HTTPS_PROXY environment handling.
+http_client = httpx.AsyncClient(
+    auth=AUTH,
+    http2=True,
+    follow_redirects=True,
+    limits=httpx.Limits(
+        max_connections=HTTP_POOL_SIZE,
+        max_keepalive_connections=HTTP_POOL_SIZE
+    )
+)
+# Retries are handled by retry_on_failure rather than the SDK
+client = AsyncOpenAI(api_key=OPENAI_API_KEY, max_retries=0)
 
 # Retry configuration
 MAX_RETRIES = 3
-RETRY_DELAY = 2  # seconds
+RETRY_INITIAL_DELAY = 1  # seconds
+RETRY_MAX_DELAY = 30  # seconds
+RETRY_AFTER_MAX = 60  # seconds; upper bound on a server's Retry-After
+
+# Concurrency configuration
+MAX_CONCURRENT_RECORDINGS = 5  # per ticket
+MAX_CONCURRENT_TICKETS = 3
 
 # --- Utility Functions ---
-def retry_on_failure(func):
-    """Decorator to retry a function on failure."""
-    def wrapper(*args, **kwargs):
-        for attempt in range(MAX_RETRIES):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                if attempt < MAX_RETRIES - 1:
-                    print(f"  Warning: Attempt {attempt + 1} failed: {str(e)}")
-                    print(f"  Retrying in {RETRY_DELAY} seconds...")
-                    time.sleep(RETRY_DELAY)
-                else:
-                    print(f"  Error: All {MAX_RETRIES} attempts failed.")
-                    raise
+class SummaryFormatError(ValueError):
+    """Raised when GPT-5 returns JSON that doesn't match the summary schema."""
+
+def is_retryable(exc: BaseException) -> bool:
+    """Return True for network errors, rate limits, server errors and malformed replies."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code == 429 or exc.status_code >= 500
+    return isinstance(exc, (httpx.TransportError, openai.APIConnectionError, json.JSONDecodeError,
+                            SummaryFormatError))
+
+exponential_backoff = wait_exponential_jitter(initial=RETRY_INITIAL_DELAY, max=RETRY_MAX_DELAY)
+
+def wait_before_retry(retry_state) -> float:
+    """Honor Retry-After on rate limited responses, otherwise back off exponentially."""
+    exc = retry_state.outcome.exception()
+    response = getattr(exc, 'response', None)
+    if response is not None and response.headers.get('retry-after'):
+        try:
+            return min(max(float(response.headers['retry-after']), 0), RETRY_AFTER_MAX)
+        except ValueError:
+            pass
+    return exponential_backoff(retry_state)
+
+def log_retry(retry_state):
+    print(f"  Warning: Attempt {retry_state.attempt_number} failed: {str(retry_state.outcome.exception())}")
+    print(f"  Retrying in {retry_state.next_action.sleep:.1f} seconds...")
+
+def log_retries_exhausted(retry_state):
+    print(f"  Error: All {MAX_RETRIES} attempts failed.")
+    # Re-raise the last exception
+    return retry_state.outcome.result()
+
+# Decorator to retry an async function on transient failures
+retry_on_failure = retry(
+    stop=stop_after_attempt(MAX_RETRIES),
+    wait=wait_before_retry,
+    retry=retry_if_exception(is_retryable),
+    before_sleep=log_retry,
+    retry_error_callback=log_retries_exhausted
+)
+
+class RateLimiter:
+    """Token bucket limiter for requests and tokens per minute.
+    
+    Callers await acquire() before each API request; it sleeps just long
+    enough to stay under both limits instead of tripping 429 retries.
+    """
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: Optional[int] = None):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.available_requests = float(requests_per_minute)
+        self.available_tokens = float(tokens_per_minute or 0)
+        self.last_refill = time.monotonic()
+    
+    def _refill(self):
+        now = time.monotonic()
+        elapsed_minutes = (now - self.last_refill) / 60
+        self.last_refill = now
+        self.available_requests = min(
+            self.requests_per_minute,
+            self.available_requests + elapsed_minutes * self.requests_per_minute
+        )
+        if self.tokens_per_minute:
+            self.available_tokens = min(
+                self.tokens_per_minute,
+                self.available_tokens + elapsed_minutes * self.tokens_per_minute
+            )
+    
+    async def acquire(self, tokens: int = 0):
+        """Wait until one request and the given number of tokens are available."""
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)
+        else:
+            tokens = 0
+        while True:
+            self._refill()
+            if self.available_requests >= 1 and self.available_tokens >= tokens:
+                self.available_requests -= 1
+                self.available_tokens -= tokens
+                return
+            wait = (1 - self.available_requests) / self.requests_per_minute * 60
+            if tokens:
+                wait = max(wait, (tokens - self.available_tokens) / self.tokens_per_minute * 60)
+            await asyncio.sleep(max(wait, 0.01))
+
+whisper_limiter = RateLimiter(WHISPER_REQUESTS_PER_MINUTE)
+gpt_limiter = RateLimiter(GPT_REQUESTS_PER_MINUTE, GPT_TOKENS_PER_MINUTE)
+
+@functools.lru_cache(maxsize=None)
+def load_token_encoding(model: str):
+    """Load the tiktoken encoding for model once, or None if unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # Encodings are downloaded on first use and may be unavailable
         return None
-    return wrapper
+
+def count_tokens(text: str, model: str = "gpt-5") -> int:
+    """Count prompt tokens in text, falling back to a character-based estimate."""
+    encoding = load_token_encoding(model)
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text))
+
+async def estimate_tokens(text: str, model: str = "gpt-5") -> int:
+    """Estimate the number of prompt tokens in text.
+    
+    Runs in the default executor, since the first call may block while
+    tiktoken downloads its encoding.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, count_tokens, text, model)
 
 def extract_ticket_id(input_str: str) -> Optional[str]:
-    """Extract ticket ID from various input formats."""
+    """Extract ticket ID from various input formats.
+    
+    IDs are normalized (e.g. 012345 -> 12345) to match what Zendesk returns.
+    """
+    ticket_id = None
     # Handle URLs like https://yourcompany.zendesk.com/agent/tickets/29333
     if input_str.startswith('http'):
-        ticket_match = re.search(r'/tickets/(\d+)', input_str)
+        ticket_match = TICKET_URL_RE.search(input_str)
         if ticket_match:
-            return ticket_match.group(1)
+            ticket_id = ticket_match.group(1)
     else:
         # Handle direct ticket numbers, removing any non-digit characters
-        ticket_id = ''.join(filter(str.isdigit, input_str))
-        if ticket_id:
-            return ticket_id
+        ticket_id = NON_DIGIT_RE.sub('', input_str)
+    if ticket_id:
+        return str(int(ticket_id))
     return None
 
 def format_duration(seconds: int) -> str:
     """Convert seconds to human-readable duration."""
-    if seconds < 60:
-        return f"{seconds}s"
-    elif seconds < 3600:
-        minutes = seconds // 60
-        secs = seconds % 60
-        return f"{minutes}m {secs}s"
-    else:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
         return f"{hours}h {minutes}m"
+    return f"{minutes}m {secs}s" if minutes else f"{secs}s"
 
 def format_timestamp(timestamp_str: str) -> str:
     """Convert ISO timestamp to human-readable format in Mountain Time."""
-    try:
-        from zoneinfo import ZoneInfo
-    except ImportError:
-        # Python < 3.9 fallback
-        try:
-            from pytz import timezone as ZoneInfo
-        except ImportError:
-            # If no timezone library available, just parse and format in UTC
-            try:
-                dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                return dt.strftime("%B %d, %Y at %I:%M %p UTC")
-            except:
-                return timestamp_str
-    
     try:
         # Parse ISO format timestamp (assuming UTC)
         dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        
-        # Convert to Mountain Time
-        mountain_tz = ZoneInfo('America/Denver')  # Handles both MST and MDT
-        dt_mountain = dt.astimezone(mountain_tz)
-        
-        # Format with timezone abbreviation
-        return dt_mountain.strftime("%B %d, %Y at %I:%M %p %Z")
+        if MOUNTAIN_TZ is None:
+            # If no timezone library available, just format in UTC
+            return dt.strftime("%B %d, %Y at %I:%M %p UTC")
+        return dt.astimezone(MOUNTAIN_TZ).strftime("%B %d, %Y at %I:%M %p %Z")
     except:
         return timestamp_str
 
+def display_summary(comment_body: str):
+    """Print a summary that could not be posted to Zendesk."""
+    print("    Summary will be displayed in console instead:")
+    print("\n" + "="*50 + " SUMMARY " + "="*50)
+    print(comment_body)
+    print("="*110 + "\n")
+
 def confirm_closed_ticket_processing() -> bool:
     """Ask user if they want to proceed with processing a closed ticket."""
     print("\nWARNING: This ticket is CLOSED.")
@@ -128,12 +313,41 @@ def confirm_closed_ticket_processing() -> bool:
         else:
             print("   Please enter 'y' for yes or 'n' for no.")
 
+async def run_prompt_in_thread(prompt):
+    """Run a blocking input() prompt without blocking the event loop.
+    
+    Uses a daemon thread rather than the default executor, which
+    asyncio.run waits for on shutdown - so Ctrl+C would otherwise hang
+    until Enter is pressed.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(setter, value):
+        if not future.done():
+            setter(value)
+    
+    def run():
+        try:
+            result = prompt()
+        except BaseException as e:
+            callback = (resolve, future.set_exception, e)
+        else:
+            callback = (resolve, future.set_result, result)
+        try:
+            loop.call_soon_threadsafe(*callback)
+        except RuntimeError:
+            pass  # Event loop already closed
+    
+    threading.Thread(target=run, daemon=True).start()
+    return await future
+
 # --- Zendesk API ---
 @retry_on_failure
-def get_ticket_details(ticket_id: str) -> Dict:
+async def get_ticket_details(ticket_id: str) -> Dict:
     """Get overall ticket info (requester, assignee, etc.)"""
     url = f'https://{ZENDESK_DOMAIN}/api/v2/tickets/{ticket_id}.json?include=users'
-    resp = requests.get(url, auth=AUTH)
+    resp = await http_client.get(url)
     resp.raise_for_status()
     data = resp.json()
     ticket = data['ticket']
@@ -142,13 +356,13 @@ def get_ticket_details(ticket_id: str) -> Dict:
     users_map = {}
     users = data.get('users', [])
     if not users:
-        for uid in (requester_id, assignee_id):
-            if uid:
-                user_url = f'https://{ZENDESK_DOMAIN}/api/v2/users/{uid}.json'
-                uresp = requests.get(user_url, auth=AUTH)
-                uresp.raise_for_status()
-                udata = uresp.json()
-                users.append(udata['user'])
+        # Look up requester and assignee in one request
+        user_ids = ','.join(str(uid) for uid in (requester_id, assignee_id) if uid)
+        if user_ids:
+            user_url = f'https://{ZENDESK_DOMAIN}/api/v2/users/show_many.json?ids={user_ids}'
+            uresp = await http_client.get(user_url)
+            uresp.raise_for_status()
+            users = uresp.json().get('users', [])
     for user in users:
         users_map[user['id']] = user['name']
     requester = users_map.get(requester_id, 'Customer')
@@ -165,10 +379,10 @@ def get_ticket_details(ticket_id: str) -> Dict:
     )
 
 @retry_on_failure
-def get_voice_recordings(ticket_id: str) -> List[Dict]:
+async def get_voice_recordings(ticket_id: str) -> List[Dict]:
     """Return all voice recordings (VoiceComment) on the ticket."""
     url = f'https://{ZENDESK_DOMAIN}/api/v2/tickets/{ticket_id}/comments.json'
-    response = requests.get(url, auth=AUTH)
+    response = await http_client.get(url)
     response.raise_for_status()
     data = response.json()
     voice_recordings = []
@@ -188,34 +402,36 @@ def get_voice_recordings(ticket_id: str) -> List[Dict]:
     return voice_recordings
 
 @retry_on_failure
-def download_recording(recording_url: str, filename: str) -> bool:
-    """Download audio file via Zendesk API auth with progress bar."""
-    resp = requests.get(recording_url, auth=AUTH, stream=True)
-    resp.raise_for_status()
-    
-    total_size = int(resp.headers.get('content-length', 0))
-    downloaded = 0
+async def download_recording(recording_url: str, filename: str) -> bool:
+    """Download audio file via Zendesk API auth.
     
-    with open(filename, 'wb') as f:
-        for chunk in resp.iter_content(8192):
-            if chunk:
-                f.write(chunk)
-                downloaded += len(chunk)
-                if total_size > 0:
-                    progress = downloaded / total_size * 100
-                    print(f"\r    Downloading: {progress:.1f}%", end='', flush=True)
+    Several downloads run at once, so progress is reported as start and
+    finish lines rather than a shared, redrawn progress bar.
+    """
+    async with http_client.stream('GET', recording_url) as resp:
+        resp.raise_for_status()
+        
+        total_size = int(resp.headers.get('content-length', 0))
+        downloaded = 0
+        loop = asyncio.get_running_loop()
+        
+        with open(filename, 'wb') as f:
+            async for chunk in resp.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                if chunk:
+                    # Write off the event loop so other downloads keep receiving
+                    await loop.run_in_executor(None, f.write, chunk)
+                    downloaded += len(chunk)
     
-    print(f"\r    Downloaded: {filename}")
+    if total_size and downloaded != total_size:
+        print(f"    Warning: {filename} is {downloaded} bytes, expected {total_size}")
+    print(f"    Downloaded: {filename} ({downloaded / (1 << 20):.1f} MB)")
 
 @retry_on_failure
-def add_private_comment(ticket_id: str, comment_body: str, is_closed: bool = False) -> bool:
+async def add_private_comment(ticket_id: str, comment_body: str, is_closed: bool = False) -> bool:
     """Add a private (non-public) comment with Markdown to the Zendesk ticket."""
     if is_closed:
         print(f"    Warning: Cannot update closed ticket {ticket_id}")
-        print("    Summary will be displayed in console instead:")
-        print("\n" + "="*50 + " SUMMARY " + "="*50)
-        print(comment_body)
-        print("="*110 + "\n")
+        display_summary(comment_body)
         return True  # Return True since we successfully processed, just didn't post
     
     url = f"https://{ZENDESK_DOMAIN}/api/v2/tickets/{ticket_id}.json"
@@ -228,25 +444,150 @@ def add_private_comment(ticket_id: str, comment_body: str, is_closed: bool = Fal
         }
     }
     try:
-        resp = requests.put(url, auth=AUTH, json=payload)
+        resp = await http_client.put(url, json=payload)
         resp.raise_for_status()
         print(f"    Added private comment to ticket {ticket_id}")
         return True
     except Exception as e:
         print(f"    Error adding comment to ticket {ticket_id}: {str(e)}")
-        print("    Summary will be displayed in console instead:")
-        print("\n" + "="*50 + " SUMMARY " + "="*50)
-        print(comment_body)
-        print("="*110 + "\n")
+        display_summary(comment_body)
         return False
 
+async def submit_bulk_comments(comments: List[Tuple[str, str]]) -> str:
+    """Queue private comments on several tickets with one update_many request.
+    
+    Returns the URL of the Zendesk job status that tracks the update. Not
+    retried: Zendesk may have queued the job even if the response is lost,
+    and sending it again would post duplicate comments.
+    """
+    url = f"https://{ZENDESK_DOMAIN}/api/v2/tickets/update_many.json"
+    payload = {
+        "tickets": [
+            {"id": int(ticket_id), "comment": {"body": comment_body, "public": False}}
+            for ticket_id, comment_body in comments
+        ]
+    }
+    resp = await http_client.put(url, json=payload)
+    resp.raise_for_status()
+    return resp.json()['job_status']['url']
+
+@retry_on_failure
+async def get_job_status(job_url: str) -> Dict:
+    """Return the current state of a Zendesk background job."""
+    resp = await http_client.get(job_url)
+    resp.raise_for_status()
+    return resp.json()['job_status']
+
+async def add_private_comments(comments: List[Tuple[str, str]]) -> Dict[str, Optional[bool]]:
+    """Add private comments to several tickets using bulk updates.
+    
+    Returns a map of ticket ID to whether its comment was added, or None
+    when the Zendesk job could not be confirmed either way. Summaries that
+    could not be posted are displayed in the console instead.
+    """
+    posted = {}
+    for start in range(0, len(comments), BULK_UPDATE_LIMIT):
+        batch = comments[start:start + BULK_UPDATE_LIMIT]
+        batch_ids = ', '.join(ticket_id for ticket_id, _ in batch)
+        try:
+            job_url = await submit_bulk_comments(batch)
+        except Exception as e:
+            print(f"    Error adding comments to tickets {batch_ids}: {str(e)}")
+            for ticket_id, comment_body in batch:
+                display_summary(comment_body)
+                posted[ticket_id] = False
+            continue
+        
+        # The job is queued at this point; if we can't see it finish, the
+        # comments are unconfirmed rather than failed
+        try:
+            deadline = time.monotonic() + JOB_POLL_TIMEOUT
+            job = await get_job_status(job_url)
+            while job['status'] in ('queued', 'working') and time.monotonic() < deadline:
+                await asyncio.sleep(JOB_POLL_INTERVAL)
+                job = await get_job_status(job_url)
+            unconfirmed_reason = None
+            if job['status'] in ('queued', 'working'):
+                unconfirmed_reason = f"job still {job['status']} after {JOB_POLL_TIMEOUT}s"
+        except Exception as e:
+            unconfirmed_reason = f"could not read job status: {str(e)}"
+        
+        if unconfirmed_reason:
+            print(f"    Warning: Could not confirm comments on tickets {batch_ids} ({unconfirmed_reason})")
+            print(f"    Zendesk is likely still processing them - check {job_url} before re-posting")
+            print("    Summaries are saved in the ticket*_combined_summary.txt files")
+            for ticket_id, _ in batch:
+                posted[ticket_id] = None
+            continue
+        
+        # Match results numerically, as the payload sends integer IDs
+        results = {}
+        for r in job.get('results') or []:
+            try:
+                results[int(r.get('id'))] = r
+            except (TypeError, ValueError):
+                pass
+        for ticket_id, comment_body in batch:
+            result = results.get(int(ticket_id), {})
+            # Tickets missing from the job results were not confirmed as posted
+            if result.get('success') is True and job['status'] == 'completed':
+                print(f"    Added private comment to ticket {ticket_id}")
+                posted[ticket_id] = True
+            else:
+                error = result.get('details') or result.get('error') or job.get('message') or job['status']
+                print(f"    Error adding comment to ticket {ticket_id}: {error}")
+                display_summary(comment_body)
+                posted[ticket_id] = False
+    return posted
+
 # --- OpenAI APIs ---
+SUMMARY_MODEL = "gpt-5"
+
+SUMMARY_SYSTEM_PROMPT = "You summarize support desk call transcripts for other support agents. Respond in JSON."
+
+SUMMARY_PROMPT_TEMPLATE = (
+    "You are a professional support desk call summarizer. "
+    "The customer is '{requester}', and the support agent is '{assignee}'. "
+    "The overall ticket subject is: '{subject}'. "
+    "Write a summary for the following support call transcript. "
+    "Do NOT use any emojis.\n\n"
+    "Respond with a JSON object with exactly these keys:\n"
+    "- \"description\": a string clearly stating what specific issue(s) the customer called about\n"
+    "- \"troubleshooting\": a list of strings, one for EVERY technical step discussed or attempted\n"
+    "- \"next_steps\": a list of strings, one for EVERY follow-up action or pending item\n\n"
+    "Be concise but ensure NO important technical details, troubleshooting steps, or follow-up items are omitted.\n"
+    "--- BEGIN CALL TRANSCRIPT ---\n"
+    "{transcript}\n"
+    "--- END CALL TRANSCRIPT ---"
+)
+
+SUMMARY_SECTIONS_TEMPLATE = (
+    "### Description of the Call\n"
+    "{description}\n\n"
+    "### Troubleshooting\n"
+    "{troubleshooting}\n\n"
+    "### Next Steps\n"
+    "{next_steps}"
+)
+
+SINGLE_CALL_TEMPLATE = "**Call on {timestamp}**\n\n{summary}"
+
+CALL_SECTION_TEMPLATE = (
+    "## Call {number} - {timestamp}\n"
+    "*Duration: {duration} | From: {caller} -> To: {callee}*\n\n"
+    "{summary}"
+)
+
 @retry_on_failure
-def transcribe_audio(file_path: str, model: str = "whisper-1") -> str:
+async def transcribe_audio(file_path: str, model: str = "whisper-1") -> str:
     """Transcribe audio file via OpenAI Whisper."""
+    # Wait for rate limit capacity before opening the file
+    await whisper_limiter.acquire()
+    # Pass the open file rather than a path: the SDK reads paths fully into
+    # memory, while file objects are streamed from disk into the multipart body
     with open(file_path, "rb") as audio_file:
         try:
-            response = client.audio.transcriptions.create(
+            response = await client.audio.transcriptions.create(
                 model=model,
                 file=audio_file,
                 response_format="text"
@@ -256,169 +597,176 @@ def transcribe_audio(file_path: str, model: str = "whisper-1") -> str:
             print(f"    Transcription error: {str(e)}")
             raise
 
+async def split_audio(file_path: str, output_dir: str) -> List[str]:
+    """Split an audio file into SEGMENT_LENGTH chunks with ffmpeg."""
+    base = Path(output_dir) / Path(file_path).stem
+    proc = await asyncio.create_subprocess_exec(
+        FFMPEG, '-hide_banner', '-loglevel', 'error', '-i', file_path,
+        '-f', 'segment', '-segment_time', str(SEGMENT_LENGTH), '-c', 'copy',
+        f"{base}_%03d.mp3",
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
+    )
+    _, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed: {stderr.decode(errors='replace').strip()}")
+    return sorted(str(p) for p in Path(output_dir).glob(f"{base.name}_*.mp3"))
+
+# Created on first use so it binds to the running event loop
+chunk_upload_semaphore: Optional[asyncio.Semaphore] = None
+
+async def transcribe_chunk(file_path: str) -> str:
+    """Transcribe one chunk of a split recording, bounded across all recordings."""
+    global chunk_upload_semaphore
+    if chunk_upload_semaphore is None:
+        chunk_upload_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNK_UPLOADS)
+    async with chunk_upload_semaphore:
+        return await transcribe_audio(file_path)
+
+async def transcribe_recording(file_path: str, duration: Optional[int] = None) -> str:
+    """Transcribe a recording, splitting long calls into chunks transcribed concurrently."""
+    if not FFMPEG or not duration or duration <= SPLIT_THRESHOLD:
+        return await transcribe_audio(file_path)
+    
+    with tempfile.TemporaryDirectory() as chunk_dir:
+        try:
+            chunks = await split_audio(file_path, chunk_dir)
+        except Exception as e:
+            print(f"    Warning: Could not split audio, transcribing as one file: {str(e)}")
+            return await transcribe_audio(file_path)
+        
+        print(f"   Transcribing {len(chunks)} chunks concurrently...")
+        tasks = [asyncio.ensure_future(transcribe_chunk(chunk)) for chunk in chunks]
+        try:
+            texts = await asyncio.gather(*tasks)
+        finally:
+            # If one chunk fails the recording fails, so stop the other uploads
+            # and let them release their files before the directory is removed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    return ' '.join(text.strip() for text in texts)
+
 @retry_on_failure
-def summarize_transcript(transcript: str, context: Dict) -> str:
+async def summarize_transcript(transcript: str, context: Dict) -> str:
     """Summarize the call transcript with context via GPT-5."""
-    prompt = (
-        f"You are a professional support desk call summarizer. "
-        f"The customer is '{context['requester']}', and the support agent is '{context['assignee']}'. "
-        f"The overall ticket subject is: '{context['subject']}'. "
-        f"Write a summary for the following support call transcript. "
-        f"Do NOT use any emojis.\n\n"
-        f"Create three clear sections, each with a markdown heading: 'Description of the Call', 'Troubleshooting', and 'Next Steps'. "
-        f"- Description: Clearly state what specific issue(s) the customer called about\n"
-        f"- Troubleshooting: List ALL technical steps discussed or attempted as bullet points\n"
-        f"- Next Steps: List ALL follow-up actions or pending items as bullet points\n\n"
-        f"Be concise but ensure NO important technical details, troubleshooting steps, or follow-up items are omitted.\n"
-        f"--- BEGIN CALL TRANSCRIPT ---\n"
-        f"{transcript}\n"
-        f"--- END CALL TRANSCRIPT ---"
+    prompt = SUMMARY_PROMPT_TEMPLATE.format(
+        requester=context['requester'],
+        assignee=context['assignee'],
+        subject=context['subject'],
+        transcript=transcript
     )
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-5",
+        await gpt_limiter.acquire(await estimate_tokens(prompt, SUMMARY_MODEL))
+        response = await client.chat.completions.create(
+            model=SUMMARY_MODEL,
             messages=[
-                {"role": "system", "content": "You summarize support desk call transcripts for other support agents."},
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
+            response_format={"type": "json_object"},
             temperature=0.2
         )
-        return response.choices[0].message.content
+        return format_call_summary(json.loads(response.choices[0].message.content))
     except Exception as e:
         print(f"    Summarization error: {str(e)}")
         raise
 
-@retry_on_failure
-def summarize_multiple_transcripts(transcripts_data: List[Dict], context: Dict) -> str:
-    """Summarize multiple call transcripts into a single comprehensive summary."""
+def format_call_summary(summary: Dict) -> str:
+    """Render a structured call summary as markdown sections.
+    
+    json_object mode doesn't enforce the schema, so fields are coerced
+    where possible and SummaryFormatError (retryable) is raised otherwise.
+    """
+    if not isinstance(summary, dict):
+        raise SummaryFormatError(f"expected a JSON object, got {type(summary).__name__}")
+    
+    def bullets(key: str) -> str:
+        items = summary.get(key)
+        if items is None:
+            items = []
+        elif isinstance(items, str):
+            items = [items]
+        elif not isinstance(items, list):
+            raise SummaryFormatError(f"'{key}' should be a list, got {type(items).__name__}")
+        items = [str(item).strip() for item in items if item is not None and str(item).strip()]
+        return '\n'.join(f"- {item}" for item in items) or "- None"
+    
+    description = summary.get('description')
+    if isinstance(description, (dict, list)):
+        raise SummaryFormatError(f"'description' should be a string, got {type(description).__name__}")
+    
+    return SUMMARY_SECTIONS_TEMPLATE.format(
+        description=str(description or '').strip() or "No description provided.",
+        troubleshooting=bullets('troubleshooting'),
+        next_steps=bullets('next_steps')
+    )
+
+def summary_cache_path(transcripts_data: List[Dict], context: Dict) -> Path:
+    """Return the cache file for a combined summary of these transcripts."""
+    # Include everything that shapes the output, so changing the model,
+    # prompts or rendering templates invalidates old entries
+    key_data = {
+        'model': SUMMARY_MODEL,
+        'prompt': [SUMMARY_SYSTEM_PROMPT, SUMMARY_PROMPT_TEMPLATE],
+        'templates': [SUMMARY_SECTIONS_TEMPLATE, SINGLE_CALL_TEMPLATE, CALL_SECTION_TEMPLATE],
+        'context': [context['requester'], context['assignee'], context['subject']],
+        'calls': [
+            [data['transcript'], data['started_at'], data['duration'], data['from'], data['to']]
+            for data in transcripts_data
+        ]
+    }
+    key = hashlib.blake2b(json.dumps(key_data).encode('utf-8'), digest_size=16).hexdigest()
+    return SUMMARY_CACHE_DIR / f"{key}.md"
+
+async def summarize_multiple_transcripts(transcripts_data: List[Dict], context: Dict) -> str:
+    """Summarize each call transcript concurrently and combine them into a single summary."""
     if len(transcripts_data) == 1:
         # Single call - just add timestamp header
         data = transcripts_data[0]
         timestamp = format_timestamp(data['started_at']) if data['started_at'] else "Unknown time"
-        summary = summarize_transcript(data['transcript'], context)
-        return f"**Call on {timestamp}**\n\n{summary}"
-    
-    # Multiple calls - create sections for each
-    prompt_parts = [
-        f"You are a professional support desk call summarizer. ",
-        f"The customer is '{context['requester']}', and the support agent is '{context['assignee']}'. ",
-        f"The overall ticket subject is: '{context['subject']}'. ",
-        f"You are summarizing {len(transcripts_data)} separate calls about the same issue. ",
-        f"Do NOT use any emojis. Do NOT use ### or any other separators between calls.\n\n",
-        f"For EACH call, you MUST capture ALL of the following:\n",
-        f"   - The specific issues or problems being addressed in that call\n",
-        f"   - All troubleshooting steps discussed or attempted during that call\n",
-        f"   - Any follow-up items, next steps, or pending actions from that call\n\n",
-        f"Create a summary for EACH call separately, with each call having its own three sections: ",
-        f"'Description of the Call', 'Troubleshooting', and 'Next Steps'. ",
-        f"- Description: Clearly state what specific issue(s) were discussed in this call\n",
-        f"- Troubleshooting: List ALL technical steps discussed or attempted as bullet points\n",
-        f"- Next Steps: List ALL follow-up actions or pending items as bullet points\n\n",
-        f"Format each call as 'CALL X' where X is the call number.\n",
-        f"Be concise but ensure NO important technical details, troubleshooting steps, or follow-up items are omitted from any call.\n\n"
-    ]
-    
-    # Add each transcript with call info
-    for i, data in enumerate(transcripts_data, 1):
-        timestamp = format_timestamp(data['started_at']) if data['started_at'] else "Unknown time"
-        duration = format_duration(data['duration']) if data['duration'] else "Unknown duration"
-        
-        prompt_parts.extend([
-            f"--- CALL {i} of {len(transcripts_data)} ---\n",
-            f"Date/Time: {timestamp}\n",
-            f"Duration: {duration}\n",
-            f"From: {data['from']} -> To: {data['to']}\n",
-            f"Call ID: {data['call_id']}\n",
-            f"--- BEGIN TRANSCRIPT ---\n",
-            f"{data['transcript']}\n",
-            f"--- END TRANSCRIPT ---\n\n"
-        ])
+        summary = await summarize_transcript(data['transcript'], context)
+        return SINGLE_CALL_TEMPLATE.format(timestamp=timestamp, summary=summary)
     
-    prompt = ''.join(prompt_parts)
+    # Multiple calls - summarize each one separately, in parallel
+    summaries = await asyncio.gather(*[
+        summarize_transcript(data['transcript'], context)
+        for data in transcripts_data
+    ])
     
-    try:
-        response = client.chat.completions.create(
-            model="gpt-5",
-            messages=[
-                {"role": "system", "content": "You summarize support desk call transcripts for other support agents. Format your response clearly with sections for each call."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2
+    # Add call headers to the summaries
+    return '\n\n---\n\n'.join(
+        CALL_SECTION_TEMPLATE.format(
+            number=i,
+            timestamp=format_timestamp(data['started_at']) if data['started_at'] else "Unknown time",
+            duration=format_duration(data['duration']) if data['duration'] else "Unknown duration",
+            caller=data['from'],
+            callee=data['to'],
+            summary=summary.strip()
         )
-        
-        # Format the response with clear call headers
-        raw_summary = response.choices[0].message.content
-        
-        # Add call headers to the summary
-        formatted_parts = []
-        call_summaries = raw_summary.split("CALL")  # Assuming GPT formats with "CALL X" headers
-        
-        for i, data in enumerate(transcripts_data):
-            timestamp = format_timestamp(data['started_at']) if data['started_at'] else "Unknown time"
-            duration = format_duration(data['duration']) if data['duration'] else "Unknown duration"
-            
-            formatted_parts.append(f"## Call {i+1} - {timestamp}")
-            formatted_parts.append(f"*Duration: {duration} | From: {data['from']} -> To: {data['to']}*\n")
-            
-            # Find the corresponding summary section
-            if i+1 < len(call_summaries):
-                # Extract the summary for this call
-                call_summary = call_summaries[i+1].strip()
-                # Remove any numbering at the start
-                call_summary = re.sub(r'^\d+.*?\n', '', call_summary, count=1)
-                # Remove any ### separators
-                call_summary = call_summary.replace('###', '').strip()
-                formatted_parts.append(call_summary)
-                if i < len(transcripts_data) - 1:  # Don't add separator after last call
-                    formatted_parts.append("\n---\n")
-        
-        return '\n'.join(formatted_parts)
-        
-    except Exception as e:
-        print(f"    Summarization error: {str(e)}")
-        raise
+        for i, (data, summary) in enumerate(zip(transcripts_data, summaries), 1)
+    )
 
 # --- Processing Functions ---
-def process_single_recording(ticket_id: str, rec: Dict, idx: int, total: int, 
-                           skip_existing: bool = False) -> Tuple[bool, str, Dict]:
+async def process_single_recording(ticket_id: str, rec: Dict, idx: int, total: int,
+                                   semaphore: asyncio.Semaphore,
+                                   skip_existing: bool = False) -> Tuple[bool, str, Dict]:
     """Download and transcribe a single voice recording."""
-    print(f"\nProcessing recording {idx}/{total} (Call ID: {rec['call_id']})")
-    
-    if rec['duration']:
-        print(f"   Duration: {format_duration(rec['duration'])}")
-    if rec['from'] and rec['to']:
-        print(f"   From: {rec['from']} -> To: {rec['to']}")
-    
-    file_basename = f"ticket{ticket_id}_call{rec['call_id']}"
-    audio_file = file_basename + ".mp3"
-    transcript_file = file_basename + ".txt"
-    
-    try:
-        # Download audio if missing
-        if not os.path.exists(audio_file):
-            print(f"   Downloading audio...")
-            download_recording(rec['recording_url'], audio_file)
-        else:
-            print(f"   Audio file exists: {audio_file}")
+    async with semaphore:
+        print(f"\nProcessing recording {idx}/{total} (Call ID: {rec['call_id']})")
         
-        # Transcribe audio
-        if not os.path.exists(transcript_file):
-            print("   Transcribing audio with Whisper...")
-            transcript = transcribe_audio(audio_file)
-            with open(transcript_file, "w", encoding="utf-8") as tf:
-                tf.write(transcript)
-            print(f"   Saved transcript: {transcript_file}")
-        else:
-            if skip_existing:
-                print("   Skipping - transcript already exists")
-                # Still load the transcript for summarization
-            print("   Loading existing transcript...")
-            with open(transcript_file, "r", encoding="utf-8") as tf:
-                transcript = tf.read()
+        if rec['duration']:
+            print(f"   Duration: {format_duration(rec['duration'])}")
+        if rec['from'] and rec['to']:
+            print(f"   From: {rec['from']} -> To: {rec['to']}")
+        
+        file_basename = f"ticket{ticket_id}_call{rec['call_id']}"
+        audio_file = file_basename + ".mp3"
+        transcript_file = file_basename + ".txt"
         
-        # Return transcript and metadata for later summarization
-        return True, transcript, {
+        # Metadata returned alongside the transcript for later summarization
+        metadata = {
             'call_id': rec['call_id'],
             'from': rec.get('from', 'Unknown'),
             'to': rec.get('to', 'Unknown'),
@@ -427,12 +775,39 @@ def process_single_recording(ticket_id: str, rec: Dict, idx: int, total: int,
             'file_basename': file_basename
         }
         
-    except Exception as e:
-        print(f"   Error processing recording: {str(e)}")
-        return False, "", {}
+        try:
+            # An existing transcript makes the audio unnecessary
+            if os.path.exists(transcript_file):
+                if skip_existing:
+                    print("   Skipping - transcript already exists")
+                    # Still load the transcript for summarization
+                print("   Loading existing transcript...")
+                transcript = Path(transcript_file).read_text(encoding="utf-8")
+                return True, transcript, metadata
+            
+            # Download audio if missing
+            if not os.path.exists(audio_file):
+                print(f"   Downloading audio: {audio_file}")
+                await download_recording(rec['recording_url'], audio_file)
+            else:
+                print(f"   Audio file exists: {audio_file}")
+            
+            # Transcribe audio
+            print("   Transcribing audio with Whisper...")
+            transcript = await transcribe_recording(audio_file, rec['duration'])
+            with open(transcript_file, "w", encoding="utf-8") as tf:
+                tf.write(transcript)
+            print(f"   Saved transcript: {transcript_file}")
+            
+            return True, transcript, metadata
+            
+        except Exception as e:
+            print(f"   Error processing recording: {str(e)}")
+            return False, "", {}
 
-def process_ticket(ticket_id: str, post_to_zendesk: bool = True, 
-                  skip_existing: bool = False) -> Dict:
+async def process_ticket(ticket_id: str, post_to_zendesk: bool = True,
+                        skip_existing: bool = False,
+                        prompt_lock: Optional[asyncio.Lock] = None) -> Dict:
     """Process all voice recordings for a ticket."""
     start_time = time.time()
     
@@ -440,9 +815,13 @@ def process_ticket(ticket_id: str, post_to_zendesk: bool = True,
     print("=" * 60)
     
     try:
-        # Get ticket details
-        print("Fetching ticket details...")
-        context = get_ticket_details(ticket_id)
+        # Get ticket details and voice recordings; neither request depends
+        # on the other, so they go out together
+        print("Fetching ticket details and voice recordings...")
+        context, recordings = await asyncio.gather(
+            get_ticket_details(ticket_id),
+            get_voice_recordings(ticket_id)
+        )
         print(f"   Subject: {context['subject']}")
         print(f"   Customer: {context['requester']}")
         print(f"   Agent: {context['assignee']}")
@@ -451,7 +830,11 @@ def process_ticket(ticket_id: str, post_to_zendesk: bool = True,
         # Check if ticket is closed
         is_closed = context['status'] == 'closed'
         if is_closed:
-            if not confirm_closed_ticket_processing():
+            # Prompt off the event loop, one ticket at a time, so other
+            # tickets keep downloading while we wait for an answer
+            async with (prompt_lock or asyncio.Lock()):
+                confirmed = await run_prompt_in_thread(confirm_closed_ticket_processing)
+            if not confirmed:
                 print("\n   Info: Skipping closed ticket processing.")
                 return {
                     'ticket_id': ticket_id,
@@ -463,10 +846,6 @@ def process_ticket(ticket_id: str, post_to_zendesk: bool = True,
             post_to_zendesk = False
             print("   Info: Processing will continue but summaries will NOT be posted to Zendesk.")
         
-        # Get voice recordings
-        print("\nSearching for voice recordings...")
-        recordings = get_voice_recordings(ticket_id)
-        
         if not recordings:
             print("   Info: No voice recordings found for this ticket.")
             return {
@@ -484,11 +863,15 @@ def process_ticket(ticket_id: str, post_to_zendesk: bool = True,
         successful = 0
         errors = 0
         
-        for idx, rec in enumerate(recordings, 1):
-            success, transcript, metadata = process_single_recording(
-                ticket_id, rec, idx, len(recordings), skip_existing
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_RECORDINGS)
+        results = await asyncio.gather(*[
+            process_single_recording(
+                ticket_id, rec, idx, len(recordings), semaphore, skip_existing
             )
-            
+            for idx, rec in enumerate(recordings, 1)
+        ])
+        
+        for success, transcript, metadata in results:
             if success and transcript:
                 successful += 1
                 transcripts_data.append({
@@ -509,9 +892,17 @@ def process_ticket(ticket_id: str, post_to_zendesk: bool = True,
             }
         
         # Phase 2: Summarize all transcripts together
+        pending_comment = None
         print(f"\nPhase 2: Summarizing {len(transcripts_data)} transcript(s) with GPT-5...")
         try:
-            combined_summary = summarize_multiple_transcripts(transcripts_data, context)
+            cache_path = summary_cache_path(transcripts_data, context)
+            if cache_path.exists():
+                print(f"   Using cached summary: {cache_path}")
+                combined_summary = cache_path.read_text(encoding="utf-8")
+            else:
+                combined_summary = await summarize_multiple_transcripts(transcripts_data, context)
+                SUMMARY_CACHE_DIR.mkdir(exist_ok=True)
+                cache_path.write_text(combined_summary, encoding="utf-8")
             
             # Save combined summary
             summary_file = f"ticket{ticket_id}_combined_summary.txt"
@@ -527,10 +918,10 @@ def process_ticket(ticket_id: str, post_to_zendesk: bool = True,
             if len(combined_summary.split('\n')) > 15:
                 print("      ...")
             
-            # Phase 3: Post to Zendesk if enabled
+            # Phase 3: Queue for posting to Zendesk once all tickets are done
             if post_to_zendesk:
-                print("\nPhase 3: Posting combined summary to Zendesk...")
-                add_private_comment(ticket_id, combined_summary, is_closed)
+                print("\nPhase 3: Summary queued for posting to Zendesk")
+                pending_comment = combined_summary
             elif is_closed:
                 print("\nPhase 3: Cannot post to closed ticket - summary displayed above")
             else:
@@ -553,7 +944,8 @@ def process_ticket(ticket_id: str, post_to_zendesk: bool = True,
             'status': 'completed',
             'recordings_processed': successful,
             'errors': errors,
-            'elapsed_time': elapsed
+            'elapsed_time': elapsed,
+            'pending_comment': pending_comment
         }
         
     except Exception as e:
@@ -564,6 +956,43 @@ def process_ticket(ticket_id: str, post_to_zendesk: bool = True,
             'error': str(e)
         }
 
+async def process_tickets(ticket_ids: List[str], post_to_zendesk: bool = True,
+                          skip_existing: bool = False,
+                          max_concurrency: int = MAX_CONCURRENT_TICKETS) -> List[Dict]:
+    """Process tickets concurrently, collecting results as they finish."""
+    # Duplicate tickets would download into the same files and post twice
+    ticket_ids = list(dict.fromkeys(ticket_ids))
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    prompt_lock = asyncio.Lock()
+    
+    async def run_one(ticket_id: str) -> Dict:
+        async with semaphore:
+            return await process_ticket(
+                ticket_id,
+                post_to_zendesk=post_to_zendesk,
+                skip_existing=skip_existing,
+                prompt_lock=prompt_lock
+            )
+    
+    results = []
+    try:
+        tasks = [asyncio.create_task(run_one(ticket_id)) for ticket_id in ticket_ids]
+        for next_done in asyncio.as_completed(tasks):
+            results.append(await next_done)
+        
+        # Post all summaries together rather than one request per ticket
+        comments = [(r['ticket_id'], r['pending_comment']) for r in results if r.get('pending_comment')]
+        if len(comments) == 1:
+            print("\nPosting summary to Zendesk...")
+            await add_private_comment(*comments[0])
+        elif comments:
+            print(f"\nPosting {len(comments)} summaries to Zendesk...")
+            await add_private_comments(comments)
+    finally:
+        await http_client.aclose()
+        await client.close()
+    return results
+
 # --- Interactive Mode ---
 def interactive_mode():
     """Interactive mode for processing tickets when run without arguments."""
@@ -571,7 +1000,7 @@ def interactive_mode():
     print("=" * 60)
     
     # Get ticket IDs
-    print("\nEnter ticket numbers or URLs (comma-separated or one per line)")
+    print("\nEnter ticket numbers or URLs (comma or space separated, or one per line)")
     print("Press Enter twice when done:")
     
     ticket_inputs = []
@@ -579,12 +1008,8 @@ def interactive_mode():
         line = input().strip()
         if not line and ticket_inputs:
             break
-        elif line:
-            # Handle comma-separated input
-            if ',' in line:
-                ticket_inputs.extend([t.strip() for t in line.split(',')])
-            else:
-                ticket_inputs.append(line)
+        # Handle comma- and space-separated input
+        ticket_inputs.extend(t for t in TICKET_SEPARATOR_RE.split(line) if t)
     
     if not ticket_inputs:
         print("Error: No tickets entered. Exiting.")
@@ -598,6 +1023,8 @@ def interactive_mode():
             ticket_ids.append(ticket_id)
         else:
             print(f"Warning: Could not extract ticket ID from: {ticket_input}")
+    # Drop duplicates (e.g. a URL and its ticket number), keeping input order
+    ticket_ids = list(dict.fromkeys(ticket_ids))
     
     if not ticket_ids:
         print("Error: No valid ticket IDs found.")
@@ -624,16 +1051,12 @@ def interactive_mode():
     input()
     
     # Process tickets
-    results = []
     total_start = time.time()
-    
-    for ticket_id in ticket_ids:
-        result = process_ticket(
-            ticket_id, 
-            post_to_zendesk=post_to_zendesk,
-            skip_existing=skip_existing
-        )
-        results.append(result)
+    results = asyncio.run(process_tickets(
+        ticket_ids,
+        post_to_zendesk=post_to_zendesk,
+        skip_existing=skip_existing
+    ))
     
     # Final summary
     total_elapsed = time.time() - total_start
@@ -671,6 +1094,7 @@ Examples:
   %(prog)s 12345 12346 12347        # Process multiple tickets
   %(prog)s --no-zendesk 12345       # Process without posting to Zendesk
   %(prog)s --skip-existing 12345    # Skip tickets with existing transcripts
+  %(prog)s --max-concurrency 5 12345 12346 12347  # Process up to 5 tickets at once
   %(prog)s https://yourcompany.zendesk.com/agent/tickets/12345  # Process from URL
             '''
         )
@@ -681,6 +1105,8 @@ Examples:
                            help='Skip posting summaries to Zendesk')
         parser.add_argument('--skip-existing', action='store_true',
                            help='Skip recordings that already have transcripts')
+        parser.add_argument('--max-concurrency', type=int, default=MAX_CONCURRENT_TICKETS,
+                           help=f'Maximum number of tickets to process at once (default: {MAX_CONCURRENT_TICKETS})')
         
         args = parser.parse_args()
         
@@ -692,6 +1118,8 @@ Examples:
                 ticket_ids.append(ticket_id)
             else:
                 print(f"Warning: Could not extract ticket ID from: {ticket_input}")
+        # Drop duplicates (e.g. a URL and its ticket number), keeping input order
+        ticket_ids = list(dict.fromkeys(ticket_ids))
         
         if not ticket_ids:
             print("Error: No valid ticket IDs found.")
@@ -703,19 +1131,17 @@ Examples:
         print(f"Tickets to process: {len(ticket_ids)}")
         print(f"Post to Zendesk: {'Yes' if not args.no_zendesk else 'No'}")
         print(f"Skip existing: {'Yes' if args.skip_existing else 'No'}")
+        print(f"Max concurrency: {args.max_concurrency}")
         print("=" * 60)
         
         # Process tickets
-        results = []
         total_start = time.time()
-        
-        for ticket_id in ticket_ids:
-            result = process_ticket(
-                ticket_id, 
-                post_to_zendesk=not args.no_zendesk,
-                skip_existing=args.skip_existing
-            )
-            results.append(result)
+        results = asyncio.run(process_tickets(
+            ticket_ids,
+            post_to_zendesk=not args.no_zendesk,
+            skip_existing=args.skip_existing,
+            max_concurrency=args.max_concurrency
+        ))
         
         # Final summary
         total_elapsed = time.time() - total_start